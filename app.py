@@ -1,269 +1,439 @@
-import React, { useState, useRef } from 'react';
+import React, { useState, useRef, useMemo, useEffect, useCallback } from 'react';
 import { Mic, Square, Pause, Play, Trash2, Save, Copy } from 'lucide-react';
 
+const languages = {
+  'English': 'en-US',
+  'Spanish': 'es-ES',
+  'French': 'fr-FR',
+  'German': 'de-DE',
+  'Chinese': 'zh-CN',
+  'Japanese': 'ja-JP',
+  'Portuguese': 'pt-PT',
+};
+
+const LANGUAGE_OPTIONS = Object.entries(languages);
+
+const STATUS_CLS = {
+  error: 'bg-red-100 text-red-800',
+  ok: 'bg-green-100 text-green-800',
+  info: 'bg-blue-100 text-blue-800',
+  listening: 'bg-blue-100 text-blue-800',
+};
+
+const NO_STATUS = { kind: 'info', text: '' };
+
+// Icon elements are created once so memoized panels see the same nodes on every render.
+const MIC_ICON = <Mic size={20} />;
+const SQUARE_ICON = <Square size={20} />;
+const PAUSE_ICON = <Pause size={20} />;
+const PLAY_ICON = <Play size={20} />;
+const TRASH_ICON = <Trash2 size={20} />;
+const SAVE_ICON = <Save size={20} />;
+const COPY_ICON = <Copy size={20} />;
+
+const HIDDEN = { display: 'none' };
+
+// Some browsers resolve blob downloads asynchronously; keep the URL alive a while after the click.
+const REVOKE_DELAY_MS = 40000;
+
+// Each card gets its own compositor layer so transcript updates don't repaint its neighbours.
+const CARD = { contain: 'layout paint', willChange: 'transform' };
+
+const Header = React.memo(function Header() {
+  return (
+    <div className="text-center mb-8">
+      <h1 className="text-4xl font-bold text-gray-800 mb-2">🎤 Speech Recognition App</h1>
+      <p className="text-gray-600">Convert your speech to text using browser's built-in Web Speech API</p>
+    </div>
+  );
+});
+
+const Sidebar = React.memo(function Sidebar({ selectedAPI, onAPIChange, selectedLanguage, onLanguageChange }) {
+  return (
+    <div className="lg:col-span-1 bg-white rounded-lg shadow-lg p-6" style={CARD}>
+      <h2 className="text-xl font-bold text-gray-800 mb-6">⚙️ Settings</h2>
+
+      <div className="mb-6">
+        <label className="block text-sm font-semibold text-gray-700 mb-2">API Type</label>
+        <select
+          value={selectedAPI}
+          onChange={(e) => onAPIChange(e.target.value)}
+          className="w-full p-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500"
+        >
+          <option value="web">Web Speech API</option>
+        </select>
+        <p className="text-xs text-gray-500 mt-2">✅ Works offline (no installation needed)</p>
+      </div>
+
+      <div>
+        <label className="block text-sm font-semibold text-gray-700 mb-2">Language</label>
+        <select
+          value={selectedLanguage}
+          onChange={(e) => onLanguageChange(e.target.value)}
+          className="w-full p-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500"
+        >
+          {LANGUAGE_OPTIONS.map(([name, code]) => (
+            <option key={code} value={code}>{name}</option>
+          ))}
+        </select>
+      </div>
+    </div>
+  );
+});
+
+const Controls = React.memo(function Controls({ isRecording, isPaused, status, interimRef, onStart, onPause, onStop }) {
+  return (
+    <div className="bg-white rounded-lg shadow-lg p-6" style={CARD}>
+      <h2 className="text-2xl font-bold text-gray-800 mb-4">Recording Controls</h2>
+
+      <div className="flex flex-wrap gap-3 mb-4">
+        <button
+          onClick={onStart}
+          disabled={isRecording}
+          className="flex items-center gap-2 px-6 py-3 bg-red-500 text-white rounded-lg font-semibold hover:bg-red-600 disabled:bg-gray-400 disabled:cursor-not-allowed transition"
+        >
+          {MIC_ICON} Start Recording
+        </button>
+
+        <button
+          onClick={onPause}
+          disabled={!isRecording}
+          className="flex items-center gap-2 px-6 py-3 bg-yellow-500 text-white rounded-lg font-semibold hover:bg-yellow-600 disabled:bg-gray-400 disabled:cursor-not-allowed transition"
+        >
+          {isPaused ? PLAY_ICON : PAUSE_ICON}
+          {isPaused ? 'Resume' : 'Pause'}
+        </button>
+
+        <button
+          onClick={onStop}
+          disabled={!isRecording}
+          className="flex items-center gap-2 px-6 py-3 bg-gray-700 text-white rounded-lg font-semibold hover:bg-gray-800 disabled:bg-gray-400 disabled:cursor-not-allowed transition"
+        >
+          {SQUARE_ICON} Stop
+        </button>
+      </div>
+
+      {/* Status Display */}
+      {status.text && (
+        <div className={`p-3 rounded-lg font-semibold ${STATUS_CLS[status.kind]}`}>
+          {status.text}
+        </div>
+      )}
+
+      {/* Interim transcript, kept mounted so it survives status changes */}
+      <p ref={interimRef} className="mt-3 p-3 bg-blue-50 text-blue-800 rounded-lg italic empty:hidden" />
+
+      {isRecording && (
+        <div className="mt-3 p-3 bg-blue-100 text-blue-800 rounded-lg font-semibold">
+          🔴 Recording is ACTIVE - Please speak now...
+        </div>
+      )}
+
+      {isPaused && (
+        <div className="mt-3 p-3 bg-yellow-100 text-yellow-800 rounded-lg font-semibold">
+          ⏸️ Recording is PAUSED
+        </div>
+      )}
+    </div>
+  );
+});
+
+const TextPanel = React.memo(function TextPanel({ text, onChange }) {
+  return (
+    <div className="bg-white rounded-lg shadow-lg p-6" style={CARD}>
+      <h2 className="text-2xl font-bold text-gray-800 mb-4">Transcribed Text</h2>
+      <textarea
+        value={text}
+        onChange={(e) => onChange(e.target.value)}
+        placeholder="Your transcribed text will appear here..."
+        className="w-full h-48 p-4 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500 resize-none"
+      />
+    </div>
+  );
+});
+
+const Actions = React.memo(function Actions({ dlRef, onCopy, onSave, onClear }) {
+  return (
+    <div className="bg-white rounded-lg shadow-lg p-6" style={CARD}>
+      <h2 className="text-2xl font-bold text-gray-800 mb-4">Actions</h2>
+      <div className="flex flex-wrap gap-3">
+        <button
+          onClick={onCopy}
+          className="flex items-center gap-2 px-6 py-3 bg-blue-500 text-white rounded-lg font-semibold hover:bg-blue-600 transition"
+        >
+          {COPY_ICON} Copy
+        </button>
+
+        <button
+          onClick={onSave}
+          className="flex items-center gap-2 px-6 py-3 bg-green-500 text-white rounded-lg font-semibold hover:bg-green-600 transition"
+        >
+          {SAVE_ICON} Save File
+        </button>
+        <a ref={dlRef} style={HIDDEN} />
+
+        <button
+          onClick={onClear}
+          className="flex items-center gap-2 px-6 py-3 bg-red-500 text-white rounded-lg font-semibold hover:bg-red-600 transition"
+        >
+          {TRASH_ICON} Clear
+        </button>
+      </div>
+    </div>
+  );
+});
+
+const Instructions = React.memo(function Instructions() {
+  return (
+    <div className="bg-indigo-50 rounded-lg shadow-lg p-6 border-l-4 border-indigo-500" style={CARD}>
+      <h3 className="text-lg font-bold text-indigo-900 mb-3">📋 How to use:</h3>
+      <ul className="space-y-2 text-indigo-800">
+        <li>✅ Choose your language from settings</li>
+        <li>✅ Click "Start Recording" and speak clearly</li>
+        <li>✅ Use Pause/Resume if needed</li>
+        <li>✅ Click "Stop" when done</li>
+        <li>✅ Copy text or save to a file</li>
+      </ul>
+    </div>
+  );
+});
+
 export default function SpeechRecognitionApp() {
-  const [transcribedText, setTranscribedText] = useState('');
+  // Finalized fragments are appended in O(1); the joined text is derived per render.
+  const fragsRef = useRef([]);
+  const [version, setVersion] = useState(0);
   const [isRecording, setIsRecording] = useState(false);
   const [isPaused, setIsPaused] = useState(false);
   const [selectedLanguage, setSelectedLanguage] = useState('en-US');
   const [selectedAPI, setSelectedAPI] = useState('web');
-  const [status, setStatus] = useState('');
+  const [status, setStatus] = useState(NO_STATUS);
   const recognitionRef = useRef(null);
+  // Pausing stops the recognizer so no audio is captured; resuming restarts the same instance.
+  const pausedRef = useRef(false);
+  // True from recognition.start() until onend; calling start() on a live instance throws.
+  const activeRef = useRef(false);
+  // Set when Resume is clicked before the paused recognizer has finished ending.
+  const resumeRef = useRef(false);
+  // Set by onerror so the onend that always follows keeps the error on screen.
+  const failedRef = useRef(false);
+  // New fragments trigger at most one render per animation frame.
+  const rafRef = useRef(0);
+  // Interim transcripts bypass React and are written straight into this node.
+  const interimRef = useRef(null);
+  const dlRef = useRef(null);
 
-  const languages = {
-    'English': 'en-US',
-    'Spanish': 'es-ES',
-    'French': 'fr-FR',
-    'German': 'de-DE',
-    'Chinese': 'zh-CN',
-    'Japanese': 'ja-JP',
-    'Portuguese': 'pt-PT',
-  };
-
-  const startRecording = () => {
-    try {
-      const SpeechRecognition = window.SpeechRecognition || window.webkitSpeechRecognition;
-      if (!SpeechRecognition) {
-        setStatus('❌ Speech Recognition not supported in your browser');
-        return;
-      }
+  const transcribedText = useMemo(() => fragsRef.current.join(' '), [version]);
 
-      const recognition = new SpeechRecognition();
-      recognition.language = selectedLanguage;
-      recognition.continuous = true;
-      recognition.interimResults = true;
-
-      recognition.onstart = () => {
-        setIsRecording(true);
-        setStatus('🎤 Listening...');
-      };
-
-      recognition.onresult = (event) => {
-        let interimTranscript = '';
-        for (let i = event.resultIndex; i < event.results.length; i++) {
-          const transcript = event.results[i][0].transcript;
-          if (event.results[i].isFinal) {
-            setTranscribedText(prev => prev + ' ' + transcript);
-          } else {
-            interimTranscript += transcript;
-          }
-        }
-        if (interimTranscript) {
-          setStatus(`🎤 Listening... "${interimTranscript}"`);
-        }
-      };
+  useEffect(() => () => cancelAnimationFrame(rafRef.current), []);
 
-      recognition.onerror = (event) => {
-        setStatus(`❌ Error: ${event.error}`);
-      };
+  const setInterim = useCallback((text) => {
+    if (interimRef.current) {
+      interimRef.current.innerText = text ? `"${text}"` : '';
+    }
+  }, []);
 
-      recognition.onend = () => {
-        setIsRecording(false);
-        setStatus('✅ Recording stopped');
-      };
+  const flushFragments = useCallback(() => {
+    rafRef.current = 0;
+    setVersion(v => v + 1);
+  }, []);
 
-      recognitionRef.current = recognition;
+  const listen = useCallback((recognition) => {
+    activeRef.current = true;
+    failedRef.current = false;
+    try {
       recognition.start();
     } catch (error) {
-      setStatus(`❌ Error: ${error.message}`);
+      activeRef.current = false;
+      setStatus({ kind: 'error', text: `❌ Error: ${error.message}` });
     }
-  };
+  }, []);
 
-  const stopRecording = () => {
+  const finishRecognition = useCallback(() => {
+    pausedRef.current = false;
+    resumeRef.current = false;
+    setInterim('');
+    setIsRecording(false);
+    setIsPaused(false);
+    if (!failedRef.current) {
+      setStatus({ kind: 'ok', text: '✅ Recording stopped' });
+    }
+  }, [setInterim]);
+
+  const getRecognition = useCallback(() => {
     if (recognitionRef.current) {
-      recognitionRef.current.stop();
-      setIsRecording(false);
-      setIsPaused(false);
+      return recognitionRef.current;
+    }
+
+    const SpeechRecognition = window.SpeechRecognition || window.webkitSpeechRecognition;
+    if (!SpeechRecognition) {
+      setStatus({ kind: 'error', text: '❌ Speech Recognition not supported in your browser' });
+      return null;
     }
-  };
 
-  const pauseRecording = () => {
+    const recognition = new SpeechRecognition();
+    recognition.continuous = true;
+    recognition.interimResults = true;
+
+    recognition.onstart = () => {
+      setIsRecording(true);
+      setStatus({ kind: 'listening', text: '🎤 Listening...' });
+    };
+
+    recognition.onresult = (event) => {
+      let interimTranscript = '';
+      let hasFinal = false;
+      for (let i = event.resultIndex; i < event.results.length; i++) {
+        const transcript = event.results[i][0].transcript;
+        if (event.results[i].isFinal) {
+          fragsRef.current.push(transcript);
+          hasFinal = true;
+        } else {
+          interimTranscript += transcript;
+        }
+      }
+      if (hasFinal && !rafRef.current) {
+        rafRef.current = requestAnimationFrame(flushFragments);
+      }
+      setInterim(interimTranscript);
+    };
+
+    recognition.onerror = (event) => {
+      failedRef.current = true;
+      setInterim('');
+      setStatus({ kind: 'error', text: `❌ Error: ${event.error}` });
+    };
+
+    recognition.onend = () => {
+      activeRef.current = false;
+      if (resumeRef.current) {
+        resumeRef.current = false;
+        listen(recognition);
+      } else if (!pausedRef.current) {
+        finishRecognition();
+      }
+    };
+
+    recognitionRef.current = recognition;
+    return recognition;
+  }, [finishRecognition, flushFragments, listen, setInterim]);
+
+  const startRecording = useCallback(() => {
+    try {
+      const recognition = getRecognition();
+      if (!recognition || activeRef.current) {
+        return;
+      }
+      recognition.lang = selectedLanguage;
+      pausedRef.current = false;
+      listen(recognition);
+    } catch (error) {
+      setStatus({ kind: 'error', text: `❌ Error: ${error.message}` });
+    }
+  }, [getRecognition, listen, selectedLanguage]);
+
+  const stopRecording = useCallback(() => {
     if (recognitionRef.current) {
-      if (isPaused) {
-        recognitionRef.current.abort();
-        startRecording();
-        setIsPaused(false);
+      // Recording state is reset in onend, so Start stays disabled until the instance is idle.
+      pausedRef.current = false;
+      resumeRef.current = false;
+      if (activeRef.current) {
+        recognitionRef.current.stop();
+      } else {
+        finishRecognition();
+      }
+    }
+  }, [finishRecognition]);
+
+  const pauseRecording = useCallback(() => {
+    const recognition = recognitionRef.current;
+    if (!recognition) {
+      return;
+    }
+    if (pausedRef.current) {
+      pausedRef.current = false;
+      if (activeRef.current) {
+        resumeRef.current = true;
       } else {
-        recognitionRef.current.abort();
-        setIsPaused(true);
-        setStatus('⏸️ Paused');
+        listen(recognition);
       }
+      setIsPaused(false);
+      setStatus({ kind: 'listening', text: '🎤 Listening...' });
+    } else {
+      pausedRef.current = true;
+      resumeRef.current = false;
+      recognition.stop();
+      setInterim('');
+      setIsPaused(true);
+      setStatus({ kind: 'info', text: '⏸️ Paused' });
     }
-  };
+  }, [listen, setInterim]);
+
+  const editText = useCallback((text) => {
+    fragsRef.current = [text];
+    setVersion(v => v + 1);
+  }, []);
 
-  const clearText = () => {
-    setTranscribedText('');
-    setStatus('');
-  };
+  const clearText = useCallback(() => {
+    fragsRef.current.length = 0;
+    setVersion(v => v + 1);
+    setStatus(NO_STATUS);
+  }, []);
 
-  const saveToFile = () => {
-    if (!transcribedText.trim()) {
-      setStatus('⚠️ No text to save');
+  const saveToFile = useCallback(() => {
+    const text = fragsRef.current.join(' ');
+    if (!text.trim()) {
+      setStatus({ kind: 'info', text: '⚠️ No text to save' });
       return;
     }
 
-    const element = document.createElement('a');
-    const file = new Blob([transcribedText], { type: 'text/plain' });
-    element.href = URL.createObjectURL(file);
+    const url = URL.createObjectURL(new Blob([text], { type: 'text/plain' }));
     const timestamp = new Date().toISOString().slice(0, 19).replace(/:/g, '-');
+    const element = dlRef.current;
+    element.href = url;
     element.download = `transcription_${timestamp}.txt`;
-    document.body.appendChild(element);
     element.click();
-    document.body.removeChild(element);
-    setStatus('✅ File saved!');
-  };
+    setTimeout(() => URL.revokeObjectURL(url), REVOKE_DELAY_MS);
+    setStatus({ kind: 'ok', text: '✅ File saved!' });
+  }, []);
 
-  const copyToClipboard = () => {
-    navigator.clipboard.writeText(transcribedText);
-    setStatus('📋 Copied to clipboard!');
-  };
+  const copyToClipboard = useCallback(() => {
+    navigator.clipboard.writeText(fragsRef.current.join(' '));
+    setStatus({ kind: 'info', text: '📋 Copied to clipboard!' });
+  }, []);
 
   return (
-    <div className="min-h-screen bg-gradient-to-br from-blue-50 to-indigo-100 p-8">
+    <div className="min-h-screen p-8">
+      {/* Fixed background layer, never invalidated by panel updates */}
+      <div className="fixed inset-0 -z-10 bg-gradient-to-br from-blue-50 to-indigo-100" />
       <div className="max-w-6xl mx-auto">
-        {/* Header */}
-        <div className="text-center mb-8">
-          <h1 className="text-4xl font-bold text-gray-800 mb-2">🎤 Speech Recognition App</h1>
-          <p className="text-gray-600">Convert your speech to text using browser's built-in Web Speech API</p>
-        </div>
+        <Header />
 
         <div className="grid grid-cols-1 lg:grid-cols-4 gap-6">
           {/* Sidebar Settings */}
-          <div className="lg:col-span-1 bg-white rounded-lg shadow-lg p-6">
-            <h2 className="text-xl font-bold text-gray-800 mb-6">⚙️ Settings</h2>
-
-            <div className="mb-6">
-              <label className="block text-sm font-semibold text-gray-700 mb-2">API Type</label>
-              <select
-                value={selectedAPI}
-                onChange={(e) => setSelectedAPI(e.target.value)}
-                className="w-full p-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500"
-              >
-                <option value="web">Web Speech API</option>
-              </select>
-              <p className="text-xs text-gray-500 mt-2">✅ Works offline (no installation needed)</p>
-            </div>
-
-            <div>
-              <label className="block text-sm font-semibold text-gray-700 mb-2">Language</label>
-              <select
-                value={selectedLanguage}
-                onChange={(e) => setSelectedLanguage(e.target.value)}
-                className="w-full p-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500"
-              >
-                {Object.entries(languages).map(([name, code]) => (
-                  <option key={code} value={code}>{name}</option>
-                ))}
-              </select>
-            </div>
-          </div>
+          <Sidebar
+            selectedAPI={selectedAPI}
+            onAPIChange={setSelectedAPI}
+            selectedLanguage={selectedLanguage}
+            onLanguageChange={setSelectedLanguage}
+          />
 
           {/* Main Content */}
           <div className="lg:col-span-3 space-y-6">
-            {/* Recording Section */}
-            <div className="bg-white rounded-lg shadow-lg p-6">
-              <h2 className="text-2xl font-bold text-gray-800 mb-4">Recording Controls</h2>
-              
-              <div className="flex flex-wrap gap-3 mb-4">
-                <button
-                  onClick={startRecording}
-                  disabled={isRecording}
-                  className="flex items-center gap-2 px-6 py-3 bg-red-500 text-white rounded-lg font-semibold hover:bg-red-600 disabled:bg-gray-400 disabled:cursor-not-allowed transition"
-                >
-                  <Mic size={20} /> Start Recording
-                </button>
-
-                <button
-                  onClick={pauseRecording}
-                  disabled={!isRecording}
-                  className="flex items-center gap-2 px-6 py-3 bg-yellow-500 text-white rounded-lg font-semibold hover:bg-yellow-600 disabled:bg-gray-400 disabled:cursor-not-allowed transition"
-                >
-                  {isPaused ? <Play size={20} /> : <Pause size={20} />}
-                  {isPaused ? 'Resume' : 'Pause'}
-                </button>
-
-                <button
-                  onClick={stopRecording}
-                  disabled={!isRecording}
-                  className="flex items-center gap-2 px-6 py-3 bg-gray-700 text-white rounded-lg font-semibold hover:bg-gray-800 disabled:bg-gray-400 disabled:cursor-not-allowed transition"
-                >
-                  <Square size={20} /> Stop
-                </button>
-              </div>
-
-              {/* Status Display */}
-              {status && (
-                <div className={`p-3 rounded-lg font-semibold ${
-                  status.includes('❌') ? 'bg-red-100 text-red-800' :
-                  status.includes('✅') ? 'bg-green-100 text-green-800' :
-                  'bg-blue-100 text-blue-800'
-                }`}>
-                  {status}
-                </div>
-              )}
-
-              {isRecording && (
-                <div className="mt-3 p-3 bg-blue-100 text-blue-800 rounded-lg font-semibold">
-                  🔴 Recording is ACTIVE - Please speak now...
-                </div>
-              )}
-
-              {isPaused && (
-                <div className="mt-3 p-3 bg-yellow-100 text-yellow-800 rounded-lg font-semibold">
-                  ⏸️ Recording is PAUSED
-                </div>
-              )}
-            </div>
-
-            {/* Text Display */}
-            <div className="bg-white rounded-lg shadow-lg p-6">
-              <h2 className="text-2xl font-bold text-gray-800 mb-4">Transcribed Text</h2>
-              <textarea
-                value={transcribedText}
-                onChange={(e) => setTranscribedText(e.target.value)}
-                placeholder="Your transcribed text will appear here..."
-                className="w-full h-48 p-4 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500 resize-none"
-              />
-            </div>
-
-            {/* Actions */}
-            <div className="bg-white rounded-lg shadow-lg p-6">
-              <h2 className="text-2xl font-bold text-gray-800 mb-4">Actions</h2>
-              <div className="flex flex-wrap gap-3">
-                <button
-                  onClick={copyToClipboard}
-                  className="flex items-center gap-2 px-6 py-3 bg-blue-500 text-white rounded-lg font-semibold hover:bg-blue-600 transition"
-                >
-                  <Copy size={20} /> Copy
-                </button>
-
-                <button
-                  onClick={saveToFile}
-                  className="flex items-center gap-2 px-6 py-3 bg-green-500 text-white rounded-lg font-semibold hover:bg-green-600 transition"
-                >
-                  <Save size={20} /> Save File
-                </button>
-
-                <button
-                  onClick={clearText}
-                  className="flex items-center gap-2 px-6 py-3 bg-red-500 text-white rounded-lg font-semibold hover:bg-red-600 transition"
-                >
-                  <Trash2 size={20} /> Clear
-                </button>
-              </div>
-            </div>
-
-            {/* Instructions */}
-            <div className="bg-indigo-50 rounded-lg shadow-lg p-6 border-l-4 border-indigo-500">
-              <h3 className="text-lg font-bold text-indigo-900 mb-3">📋 How to use:</h3>
-              <ul className="space-y-2 text-indigo-800">
-                <li>✅ Choose your language from settings</li>
-                <li>✅ Click "Start Recording" and speak clearly</li>
-                <li>✅ Use Pause/Resume if needed</li>
-                <li>✅ Click "Stop" when done</li>
-                <li>✅ Copy text or save to a file</li>
-              </ul>
-            </div>
+            <Controls
+              isRecording={isRecording}
+              isPaused={isPaused}
+              status={status}
+              interimRef={interimRef}
+              onStart={startRecording}
+              onPause={pauseRecording}
+              onStop={stopRecording}
+            />
+
+            <TextPanel text={transcribedText} onChange={editText} />
+
+            <Actions dlRef={dlRef} onCopy={copyToClipboard} onSave={saveToFile} onClear={clearText} />
+
+            <Instructions />
           </div>
         </div>
       </div>